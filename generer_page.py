@@ -8,168 +8,343 @@ Generator for bilingual personal page with Markdown support.
 Converts YAML content to HTML pages (FR/EN).
 """
 
+import hashlib
+import io
 import re
+import shutil
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+# Use the libyaml-backed loader when available (much faster), otherwise
+# fall back to the pure-Python one. Both parse the same safe YAML subset.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 # =============================================================================
 # MARKDOWN TO HTML CONVERSION
 # =============================================================================
 
+# Bullet lines start with one of these characters followed by whitespace
+_BULLET_CHARS = ('•', '-')
+# HTML fragments, appended as-is to the output list (no per-item f-strings)
+_UL_OPEN, _UL_CLOSE = '<ul>', '</ul>'
+_LI_OPEN, _LI_CLOSE = '<li>', '</li>'
+_P_OPEN, _P_CLOSE = '<p>', '</p>'
+_BR = '<br>'
+
+@lru_cache(maxsize=64)
 def markdown_to_html(text: str) -> str:
     """
     Convert Markdown-style text to HTML.
     Supports: links, paragraphs, bullet points (• or -).
     
-    Optimized with compiled regex patterns for faster execution.
+    Single pass over the lines: a paragraph is buffered only until its
+    first bullet, after which lines are emitted as they come.
     """
     if not text:
         return ""
     
-    # Pre-compiled patterns for performance
-    link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
-    bullet_pattern = re.compile(r'^[•\-]\s+', re.MULTILINE)
+    # Fast path: a single line with no link and no bullet is one paragraph
+    stripped = text.strip()
+    if '\n' not in stripped and '[' not in stripped and not stripped.startswith(_BULLET_CHARS):
+        return _P_OPEN + stripped + _P_CLOSE if stripped else ""
     
     # Convert Markdown links [text](url) to <a> tags
-    text = link_pattern.sub(r'<a href="\2" target="_blank">\1</a>', text)
+    text = _convert_links(text).strip()
     
-    # Split into paragraphs
-    paragraphs = text.strip().split('\n\n')
-    html_parts = []
+    out = []
+    para_lines = []   # non-blank lines of a paragraph with no bullet so far
+    list_items = []   # pending <li> items
+    mixed = False     # current paragraph has bullets: one <p> per text line
     
-    for para in paragraphs:
-        para = para.strip()
-        if not para:
+    # Bound methods and constants as locals: this loop runs once per line
+    append = out.append
+    bullet_chars = _BULLET_CHARS
+    
+    # An empty line ends the paragraph; the extra '' flushes the last one
+    lines = text.split('\n')
+    lines.append('')
+    for line in lines:
+        if not line:
+            if list_items:
+                _render_ul(list_items, out)
+                list_items = []
+            elif para_lines:
+                # Regular paragraph: single newlines become <br>
+                if out:
+                    append('\n')
+                out += (_P_OPEN, _BR.join(para_lines), _P_CLOSE)
+                para_lines = []
+            mixed = False
             continue
         
-        # Check if paragraph contains bullet points
-        lines = para.split('\n')
-        bullet_lines = [l for l in lines if bullet_pattern.match(l.strip())]
-        
-        if bullet_lines and len(bullet_lines) == len(lines):
-            # All lines are bullets -> create <ul>
-            items = [bullet_pattern.sub('', l.strip()) for l in lines]
-            html_parts.append('<ul>' + ''.join(f'<li>{item}</li>' for item in items) + '</ul>')
-        elif bullet_lines:
-            # Mixed content: process line by line
-            result = []
-            in_list = False
-            list_items = []
-            
-            for line in lines:
-                line = line.strip()
-                if bullet_pattern.match(line):
-                    if not in_list:
-                        in_list = True
-                    list_items.append(bullet_pattern.sub('', line))
-                else:
-                    if in_list:
-                        result.append('<ul>' + ''.join(f'<li>{item}</li>' for item in list_items) + '</ul>')
-                        list_items = []
-                        in_list = False
-                    if line:
-                        result.append(f'<p>{line}</p>')
-            
+        line = line.strip()
+        if line.startswith(bullet_chars) and line[1:2].isspace():
+            if not mixed:
+                # First bullet: earlier lines become separate paragraphs
+                if out:
+                    append('\n')
+                for l in para_lines:
+                    out += (_P_OPEN, l, _P_CLOSE)
+                para_lines = []
+                mixed = True
+            list_items.append(line[1:].lstrip())
+        elif mixed:
+            # Text (or blank) line closes the current list
             if list_items:
-                result.append('<ul>' + ''.join(f'<li>{item}</li>' for item in list_items) + '</ul>')
-            
-            html_parts.append(''.join(result))
-        else:
-            # Regular paragraph
-            # Join lines with <br> for single newlines within paragraph
-            joined = '<br>'.join(l.strip() for l in lines if l.strip())
-            html_parts.append(f'<p>{joined}</p>')
+                _render_ul(list_items, out)
+                list_items = []
+            if line:
+                out += (_P_OPEN, line, _P_CLOSE)
+        elif line:
+            para_lines.append(line)
     
-    return '\n'.join(html_parts)
+    return ''.join(out)
+
+
+def _convert_links(text: str) -> str:
+    """
+    Replace Markdown links [text](url) with <a> tags using substring
+    searches. The text runs to the first ']' and the URL to the first ')';
+    both must be non-empty.
+    """
+    parts = []
+    pos = 0
+    start = text.find('[')
+    while start >= 0:
+        close = text.find(']', start + 1)
+        if close < 0:
+            break
+        if close > start + 1 and text.startswith('(', close + 1):
+            end = text.find(')', close + 2)
+            if end < 0:
+                break
+            if end > close + 2:
+                parts.append(text[pos:start])
+                parts.append(f'<a href="{text[close + 2:end]}" target="_blank">{text[start + 1:close]}</a>')
+                pos = end + 1
+                start = text.find('[', pos)
+                continue
+        start = text.find('[', start + 1)
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+def _render_ul(items: list[str], out: list[str]) -> None:
+    """Append a <ul> list of items to the output accumulator."""
+    out.append(_UL_OPEN)
+    for item in items:
+        out += (_LI_OPEN, item, _LI_CLOSE)
+    out.append(_UL_CLOSE)
 
 
 # =============================================================================
 # YOUTUBE ID EXTRACTION
 # =============================================================================
 
-# Pre-compiled pattern for YouTube URL parsing
-YOUTUBE_PATTERN = re.compile(
-    r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([a-zA-Z0-9_-]{11})'
-)
+# Supported URL prefixes, followed directly by the 11-character video ID
+_YOUTUBE_PREFIXES = ('youtube.com/watch?v=', 'youtu.be/', 'youtube.com/embed/')
+_YT_ID_RE = re.compile(r'[a-zA-Z0-9_-]{11}')
 
 def extract_youtube_id(url: str) -> str:
     """
     Extract YouTube video ID from various URL formats.
     Returns empty string if no valid ID found.
     """
-    match = YOUTUBE_PATTERN.search(url)
-    return match.group(1) if match else ""
+    # Locate the prefix with a plain substring search, then only check
+    # the ID itself with the regex
+    for prefix in _YOUTUBE_PREFIXES:
+        idx = url.find(prefix)
+        if idx >= 0:
+            start = idx + len(prefix)
+            if _YT_ID_RE.match(url, start):
+                return url[start:start + 11]
+    return ""
 
 
 # =============================================================================
 # TEMPLATE RENDERING
 # =============================================================================
 
+# Pre-compiled template patterns (compiled once, reused for every language)
+_TPL_FOR_RE = re.compile(
+    r'\{%\s*for\s+(\w+)\s+in\s+(\w+)\s*%\}(.*?)\{%\s*endfor\s*%\}',
+    re.DOTALL
+)
+_TPL_COND_RE = re.compile(
+    r"\{\{\s*'([^']+)'\s+if\s+(\w+)\s*==\s*'([^']+)'\s+else\s*'([^']*)'\s*\}\}"
+)
+_TPL_VAR_RE = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+# Either a for loop (groups 1-3) or a conditional (groups 4-7)
+_TPL_BLOCK_RE = re.compile(f'{_TPL_FOR_RE.pattern}|{_TPL_COND_RE.pattern}', re.DOTALL)
+
+
+class _SafeDict(dict):
+    """
+    Mapping for str.format_map that leaves unknown variables in place.
+    `prefix` restores loop placeholders, e.g. 'item.' for {{ item.key }}.
+    """
+    def __init__(self, values: dict[str, str], prefix: str = ''):
+        super().__init__(values)
+        self.prefix = prefix
+    
+    def __missing__(self, key: str) -> str:
+        return '{{ ' + self.prefix + key + ' }}'
+
+
+class _LazyScalars(_SafeDict):
+    """
+    _SafeDict reading scalar variables from a render context on demand,
+    so deferred (callable) entries are only evaluated if they are used.
+    """
+    def __init__(self, context: dict[str, Any]):
+        super().__init__({})
+        self.context = context
+    
+    def __missing__(self, key: str) -> str:
+        if key not in self.context:
+            return super().__missing__(key)
+        value = _resolve(self.context, key)
+        if isinstance(value, (list, dict)):
+            return super().__missing__(key)
+        self[key] = text = str(value)
+        return text
+
+
+def _resolve(context: dict[str, Any], key: str, default: Any = None) -> Any:
+    """
+    Look up a context value, evaluating and caching it if it is deferred
+    (a zero-argument callable).
+    """
+    value = context.get(key, default)
+    if callable(value):
+        value = context[key] = value()
+    return value
+
+
+def _to_format(text: str, pattern: re.Pattern = _TPL_VAR_RE) -> str:
+    """
+    Convert template text to str.format syntax: placeholders matched by
+    `pattern` ({{ variable }} by default) become {variable} and every
+    other brace is doubled so it stays literal.
+    """
+    parts = []
+    pos = 0
+    for match in pattern.finditer(text):
+        parts.append(text[pos:match.start()].replace('{', '{{').replace('}', '}}'))
+        name = match.group(1)
+        if name.isidentifier():
+            parts.append('{' + name + '}')
+        else:
+            # e.g. {{ 0 }} would be read as a positional field
+            parts.append(match.group(0).replace('{', '{{').replace('}', '}}'))
+        pos = match.end()
+    parts.append(text[pos:].replace('{', '{{').replace('}', '}}'))
+    return ''.join(parts)
+
+
+def compile_template(template: str) -> str:
+    """
+    Translate a template to str.format syntax once, so that rendering each
+    language is a single C-level format_map pass.
+    {% for %} blocks and conditionals are kept verbatim.
+    """
+    parts = []
+    pos = 0
+    for match in _TPL_BLOCK_RE.finditer(template):
+        parts.append(_to_format(template[pos:match.start()]))
+        parts.append(match.group(0))
+        pos = match.end()
+    parts.append(_to_format(template[pos:]))
+    return ''.join(parts)
+
+
 def render_template(template: str, context: dict[str, Any]) -> str:
     """
     Simple template rendering with Jinja2-like syntax.
     Supports: {{ variable }}, {% for %}, {% if %}, conditionals.
     """
-    result = template
-    
-    # Process for loops first: {% for item in items %}...{% endfor %}
-    for_pattern = re.compile(
-        r'\{%\s*for\s+(\w+)\s+in\s+(\w+)\s*%\}(.*?)\{%\s*endfor\s*%\}',
-        re.DOTALL
-    )
+    return render_compiled(compile_template(template), context)
+
+
+def render_compiled(compiled: str, context: dict[str, Any]) -> str:
+    """
+    Render a template already translated by compile_template.
+    """
+    buffer = io.StringIO()
+    write_compiled(compiled, context, buffer)
+    return buffer.getvalue()
+
+
+def write_compiled(compiled: str, context: dict[str, Any], out: TextIO) -> None:
+    """
+    Render a template already translated by compile_template, writing it
+    piece by piece to `out` instead of building the whole page in memory.
+    Deferred (callable) context values are evaluated the first time the
+    template uses them.
+    """
+    # Process conditionals: {{ 'value1' if condition else 'value2' }}
+    def replace_cond(val_true: str, var: str, check_val: str, val_false: str) -> str:
+        return val_true if _resolve(context, var) == check_val else val_false
     
-    def replace_for(match):
-        var_name = match.group(1)
-        list_name = match.group(2)
-        body = match.group(3)
-        
-        items = context.get(list_name, [])
+    # Process for loops: {% for item in items %}...{% endfor %}
+    def replace_for(var_name: str, list_name: str, body: str) -> str:
+        items = _resolve(context, list_name, [])
         if not items:
             return ""
         
-        rendered_items = []
-        for item in items:
-            item_body = body
-            # Replace {{ var.attr }} patterns
-            for key, value in item.items():
-                item_body = item_body.replace(f'{{{{ {var_name}.{key} }}}}', str(value))
-            rendered_items.append(item_body)
+        # Translate {{ var.attr }} to {attr} once, then one format pass per item
+        attr_pattern = re.compile(r'\{\{\s*' + re.escape(var_name) + r'\.(\w+)\s*\}\}')
+        body_fmt = _to_format(body, attr_pattern)
+        prefix = var_name + '.'
+        rendered_items = [
+            body_fmt.format_map(_SafeDict({k: str(v) for k, v in item.items()}, prefix))
+            for item in items
+        ]
         
-        return ''.join(rendered_items)
-    
-    result = for_pattern.sub(replace_for, result)
-    
-    # Process conditionals: {{ 'value1' if condition else 'value2' }}
-    cond_pattern = re.compile(r"\{\{\s*'([^']+)'\s+if\s+(\w+)\s*==\s*'([^']+)'\s+else\s*'([^']*)'\s*\}\}")
+        # Conditionals inside the loop body
+        return _TPL_COND_RE.sub(lambda m: replace_cond(*m.groups()), ''.join(rendered_items))
     
-    def replace_cond(match):
-        val_true, var, check_val, val_false = match.groups()
-        return val_true if context.get(var) == check_val else val_false
-    
-    result = cond_pattern.sub(replace_cond, result)
-    
-    # Replace simple variables: {{ variable }}
-    for key, value in context.items():
-        if not isinstance(value, (list, dict)):
-            result = result.replace(f'{{{{ {key} }}}}', str(value))
-    
-    return result
+    # Replace simple variables: {{ variable }} -> {variable}
+    # Text between blocks and each block's output are complete format
+    # strings, so they can be filled and written one at a time.
+    scalars = _LazyScalars(context)
+    pos = 0
+    for match in _TPL_BLOCK_RE.finditer(compiled):
+        out.write(compiled[pos:match.start()].format_map(scalars))
+        if match.group(1) is not None:
+            rendered = replace_for(*match.group(1, 2, 3))
+        else:
+            rendered = replace_cond(*match.group(4, 5, 6, 7))
+        out.write(_to_format(rendered).format_map(scalars))
+        pos = match.end()
+    out.write(compiled[pos:].format_map(scalars))
 
 
 # =============================================================================
 # CONTEXT BUILDER
 # =============================================================================
 
-def get_text(obj: dict, key: str, lang: str) -> str:
+_LANGS = {'fr', 'en'}
+
+def _flatten_bilingual(node: Any, lang: str) -> Any:
     """
-    Extract text for given language from a bilingual dict.
+    Return a copy of the config tree where every bilingual dict
+    ({fr: ..., en: ...}) is replaced by its text for `lang`.
     Falls back to 'fr' if lang not found.
     """
-    value = obj.get(key, {})
-    if isinstance(value, dict):
-        return value.get(lang, value.get('fr', ''))
-    return str(value)
+    if isinstance(node, dict):
+        if node and node.keys() <= _LANGS:
+            return node.get(lang, node.get('fr', ''))
+        return {key: _flatten_bilingual(value, lang) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_flatten_bilingual(value, lang) for value in node]
+    return node
 
 
 def _render_outils_grid(outils_config: dict, lang: str) -> str:
@@ -219,13 +394,40 @@ def _render_outils_grid(outils_config: dict, lang: str) -> str:
     return ''.join(parts)
 
 
-def build_context(config: dict, lang: str) -> dict[str, Any]:
+def prepare_sections(config: dict) -> dict[str, Any]:
+    """
+    Extract the language-independent parts of the YAML config once,
+    so they can be shared by every call to build_context.
+    """
+    return {
+        # Raw (bilingual) tools config, rendered by _render_outils_grid
+        'outils': config.get('outils', {}),
+        # YouTube IDs, in the same order as medias.videos
+        'video_ids': [extract_youtube_id(v.get('url', ''))
+                      for v in config.get('medias', {}).get('videos', [])],
+    }
+
+
+def build_context(config: dict, lang: str,
+                  sections: dict[str, Any] | None = None) -> dict[str, Any]:
     """
     Build template context from YAML config for specified language.
+    `sections` is the output of prepare_sections(config); it is computed
+    here if not given.
+    Costly entries (Markdown fields, videos, discoveries) are deferred as
+    zero-argument callables, evaluated by render_compiled only when used.
     """
-    # Helper for bilingual fields
-    def t(obj: dict, key: str) -> str:
-        return get_text(obj, key, lang)
+    if sections is None:
+        sections = prepare_sections(config)
+    
+    # Bilingual fields resolved once: plain lookups from here on
+    cfg = _flatten_bilingual(config, lang)
+    medias = cfg.get('medias', {})
+    recherche = cfg.get('recherche', {})
+    outils = cfg.get('outils', {})
+    oiseaux = cfg.get('oiseaux', {})
+    liens = cfg.get('liens', {})
+    affiliation = cfg.get('affiliation', {})
     
     # Navigation labels
     nav_labels = {
@@ -236,40 +438,35 @@ def build_context(config: dict, lang: str) -> dict[str, Any]:
     }
     labels = nav_labels.get(lang, nav_labels['fr'])
     
-    # Process videos
-    videos = []
-    for v in config.get('medias', {}).get('videos', []):
-        video_id = extract_youtube_id(v.get('url', ''))
-        if video_id:
-            videos.append({
-                'video_id': video_id,
-                'titre': t(v, 'titre')
-            })
+    # Process videos (built only if the template loops over them)
+    def videos() -> list[dict[str, str]]:
+        return [
+            {'video_id': video_id, 'titre': v.get('titre', '')}
+            for video_id, v in zip(sections['video_ids'], medias.get('videos', [])) if video_id
+        ]
     
-    # Process discoveries
-    decouvertes = []
-    for d in config.get('medias', {}).get('decouvertes', []):
-        decouvertes.append({
-            'titre': t(d, 'titre'),
-            'annee': d.get('annee', ''),
-            'url': d.get('url', '')
-        })
+    # Process discoveries (built only if the template loops over them)
+    def decouvertes() -> list[dict[str, Any]]:
+        return [
+            {'titre': d.get('titre', ''), 'annee': d.get('annee', ''), 'url': d.get('url', '')}
+            for d in medias.get('decouvertes', [])
+        ]
     
     # Build context dict
     context = {
         'lang': lang,
-        'nom': config.get('nom', ''),
-        'titre': t(config, 'titre'),
-        'photo': config.get('photo', ''),
-        'css_path': config.get('css_path', ''),
+        'nom': cfg.get('nom', ''),
+        'titre': cfg.get('titre', ''),
+        'photo': cfg.get('photo', ''),
+        'css_path': cfg.get('css_path', ''),
         
         # Affiliation (with links)
-        'affiliation_inst': f'<a href="{config.get("liens", {}).get("udem", "")}" target="_blank">{config.get("affiliation", {}).get("institution", "")}</a>',
-        'affiliation_dept': f'<a href="{config.get("liens", {}).get("irex", "")}" target="_blank">{t(config.get("affiliation", {}), "departement")}</a>',
+        'affiliation_inst': f'<a href="{liens.get("udem", "")}" target="_blank">{affiliation.get("institution", "")}</a>',
+        'affiliation_dept': f'<a href="{liens.get("irex", "")}" target="_blank">{affiliation.get("departement", "")}</a>',
         
         # Liens
-        'email': config.get('liens', {}).get('email', ''),
-        'orcid': config.get('liens', {}).get('orcid', ''),
+        'email': liens.get('email', ''),
+        'orcid': liens.get('orcid', ''),
         
         # Navigation
         'nav_recherche': labels['recherche'],
@@ -280,42 +477,35 @@ def build_context(config: dict, lang: str) -> dict[str, Any]:
         'oiseaux_bouton': labels['gallery'],
         
         # Intro
-        'intro': t(config, 'intro').strip(),
+        'intro': str(cfg.get('intro', '')).strip(),
         
         # Recherche - convert Markdown to HTML
-        'recherche_titre': t(config.get('recherche', {}), 'titre'),
-        'recherche_photo': config.get('recherche', {}).get('photo', ''),
-        'recherche_contenu': markdown_to_html(t(config.get('recherche', {}), 'contenu')),
+        'recherche_titre': recherche.get('titre', ''),
+        'recherche_photo': recherche.get('photo', ''),
+        'recherche_contenu': lambda: markdown_to_html(str(recherche.get('contenu', ''))),
         
         # Médias
-        'medias_titre': t(config.get('medias', {}), 'titre'),
-        'ads_url': config.get('medias', {}).get('ads_url', ''),
-        'ads_texte': t(config.get('medias', {}), 'ads_texte'),
-        'decouvertes_titre': t(config.get('medias', {}), 'decouvertes_titre'),
+        'medias_titre': medias.get('titre', ''),
+        'ads_url': medias.get('ads_url', ''),
+        'ads_texte': medias.get('ads_texte', ''),
+        'decouvertes_titre': medias.get('decouvertes_titre', ''),
         'videos': videos,
         'decouvertes': decouvertes,
         
         # Outils
-        'outils_titre': t(config.get('outils', {}), 'titre'),
-        'outils_html': _render_outils_grid(config.get('outils', {}), lang),
+        'outils_titre': outils.get('titre', ''),
+        'outils_html': _render_outils_grid(sections['outils'], lang),
 
         # Oiseaux - convert Markdown to HTML
-        'oiseaux_titre': t(config.get('oiseaux', {}), 'titre'),
-        'oiseaux_photo': config.get('oiseaux', {}).get('photo', ''),
-        'oiseaux_contenu': markdown_to_html(t(config.get('oiseaux', {}), 'contenu')),
-        'oiseaux_lien': config.get('liens', {}).get('galerie_oiseaux', '').replace('_fr', f'_{lang}'),
+        'oiseaux_titre': oiseaux.get('titre', ''),
+        'oiseaux_photo': oiseaux.get('photo', ''),
+        'oiseaux_contenu': lambda: markdown_to_html(str(oiseaux.get('contenu', ''))),
+        'oiseaux_lien': liens.get('galerie_oiseaux', '').replace('_fr', f'_{lang}'),
         
-        # Footer
-        'footer_text': t(config.get('footer', {'fr': '', 'en': ''}), 'fr' if lang == 'fr' else 'en')
-            if isinstance(config.get('footer'), dict) 
-            else config.get('footer', {}).get(lang, '')
+        # Footer (simple {fr: ..., en: ...} dict)
+        'footer_text': cfg.get('footer', ''),
     }
     
-    # Fix footer for simple dict structure
-    footer = config.get('footer', {})
-    if isinstance(footer, dict):
-        context['footer_text'] = footer.get(lang, footer.get('fr', ''))
-    
     return context
 
 
@@ -323,53 +513,104 @@ def build_context(config: dict, lang: str) -> dict[str, Any]:
 # MAIN GENERATOR
 # =============================================================================
 
+# Redirect page picking FR/EN from the browser language (encoded once at import)
+_REDIRECT_HTML = '''<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta http-equiv="refresh" content="0; url=index_fr.html">
+    <script>
+        const userLang = navigator.language || navigator.userLanguage;
+        const targetLang = userLang.startsWith('fr') ? 'fr' : 'en';
+        window.location.href = 'index_' + targetLang + '.html';
+    </script>
+</head>
+<body>
+    <p>Redirecting... <a href="index_fr.html">Français</a> | <a href="index_en.html">English</a></p>
+</body>
+</html>'''.encode('utf-8')
+
+
+def _cache_key(*paths: str | Path) -> str:
+    """
+    Content hash of the given files: the cached pages are reused only if
+    none of them changed.
+    """
+    h = hashlib.blake2b()
+    for path in paths:
+        h.update(Path(path).read_bytes())
+    return h.hexdigest()
+
+
 def generate_pages(config_path: str = 'content.yaml', 
                    template_path: str = 'template.html',
-                   output_dir: str = '.') -> None:
+                   output_dir: str = '.',
+                   use_cache: bool = True) -> None:
     """
     Generate bilingual HTML pages from YAML config.
     Creates: index_fr.html, index_en.html, index.html (redirect)
+    Rendered pages are cached in <output_dir>/.cache, keyed by the content
+    of the config, the template and this script.
+    """
+    output_path = Path(output_dir)
+    langs = ['fr', 'en']
+    
+    # Reuse the cached pages if no input changed
+    cache_dir = output_path / '.cache'
+    key = _cache_key(config_path, template_path, __file__)
+    cached = {lang: cache_dir / f'{key}_{lang}.html' for lang in langs}
+    if use_cache and all(path.is_file() for path in cached.values()):
+        for lang in langs:
+            out_file = output_path / f'index_{lang}.html'
+            shutil.copyfile(cached[lang], out_file)
+            print(f"✓ Generated: {out_file} (cached)")
+    else:
+        _render_pages(config_path, template_path, output_path, langs)
+        if use_cache:
+            # Keep only the current entries
+            cache_dir.mkdir(exist_ok=True)
+            for old in cache_dir.glob('*.html'):
+                old.unlink()
+            for lang in langs:
+                shutil.copyfile(output_path / f'index_{lang}.html', cached[lang])
+    
+    # Create redirect index.html
+    (output_path / 'index.html').write_bytes(_REDIRECT_HTML)
+    print("✓ Generated: index.html (redirect)")
+
+
+def _render_pages(config_path: str, template_path: str,
+                  output_path: Path, langs: list[str]) -> None:
+    """
+    Run the full pipeline: parse the config, render and write one page
+    per language.
     """
     # Load config
     with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlLoader)
     
     # Load template
     with open(template_path, 'r', encoding='utf-8') as f:
         template = f.read()
+    compiled = compile_template(template)
     
-    output_path = Path(output_dir)
+    # Language-independent lookups, shared by both passes
+    sections = prepare_sections(config)
     
-    # Generate for each language
-    for lang in ['fr', 'en']:
-        context = build_context(config, lang)
-        html = render_template(template, context)
+    # Generate one language (config, sections and template are only read)
+    def generate_lang(lang: str) -> Path:
+        context = build_context(config, lang, sections)
         
+        # Stream the page to disk; newline='' keeps '\n' on every platform
         out_file = output_path / f'index_{lang}.html'
-        with open(out_file, 'w', encoding='utf-8') as f:
-            f.write(html)
-        print(f"✓ Generated: {out_file}")
-    
-    # Create redirect index.html
-    redirect_html = '''<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta http-equiv="refresh" content="0; url=index_fr.html">
-    <script>
-        const userLang = navigator.language || navigator.userLanguage;
-        const targetLang = userLang.startsWith('fr') ? 'fr' : 'en';
-        window.location.href = 'index_' + targetLang + '.html';
-    </script>
-</head>
-<body>
-    <p>Redirecting... <a href="index_fr.html">Français</a> | <a href="index_en.html">English</a></p>
-</body>
-</html>'''
+        with open(out_file, 'w', encoding='utf-8', newline='') as f:
+            write_compiled(compiled, context, f)
+        return out_file
     
-    with open(output_path / 'index.html', 'w', encoding='utf-8') as f:
-        f.write(redirect_html)
-    print("✓ Generated: index.html (redirect)")
+    # Both languages are independent: render them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for out_file in executor.map(generate_lang, langs):
+            print(f"✓ Generated: {out_file}")
 
 
 if __name__ == '__main__':